@@ -0,0 +1,79 @@
+"""Entry point behind agent_wt.cli.main: fast paths, parsing, and handler dispatch."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+from .cli import HELP, STATIC_HELP_OK, STATIC_USAGE_OK, USAGE, VERSION
+
+
+def _run_gui(ns, ctx) -> None:
+    from .gui import run_gui  # late import to avoid tkinter dependency when unused
+
+    run_gui(ctx)
+
+
+# command -> (module, attribute); resolved on dispatch so only the needed module is imported.
+_DISPATCH = {
+    "create": (".core", "handle_create"),
+    "run": (".core", "handle_run"),
+    "list": (".core", "handle_list"),
+    "info": (".core", "handle_info"),
+    "set": (".core", "handle_set"),
+    "set-env": (".core", "handle_set_env"),
+    "remove": (".core", "handle_remove"),
+    "prune": (".core", "handle_prune"),
+    "git": (".core", "handle_git"),
+    "open": (".core", "handle_open"),
+    "diff": (".core", "handle_diff"),
+    "commit": (".core", "handle_commit"),
+    "push": (".core", "handle_push"),
+    "gui": ("._main", "_run_gui"),
+}
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    if argv and argv[0] in ("version", "-V", "--version"):
+        sys.stdout.write(f"{VERSION}\n")
+        return
+    if not argv or argv[0] in ("-h", "--help"):
+        if STATIC_HELP_OK:
+            sys.stdout.write(HELP)
+        else:
+            from ._parser import cached_parser
+
+            cached_parser().print_help()
+        return
+
+    command, rest = argv[0], argv[1:]
+    handler_ref = _DISPATCH.get(command)
+    if handler_ref is None:
+        # Unknown command or top-level options: let the full parser report or print help.
+        from ._parser import cached_parser
+
+        parser = cached_parser()
+        parser.parse_args(argv)
+        sys.stdout.write(USAGE if STATIC_USAGE_OK else parser.format_usage())
+        sys.exit(1)
+
+    from ._parser import cached_subparser
+
+    args = cached_subparser(command).parse_args(rest)
+    args.command = command
+
+    # Handlers live in .core; import them only once we know which one is needed.
+    from .core import ensure_git_repo, ensure_macos, log_error
+    from .errors import UserError
+
+    try:
+        ensure_macos()
+        ctx = ensure_git_repo(Path.cwd())
+        module_name, attr = handler_ref
+        handler = getattr(importlib.import_module(module_name, __package__), attr)
+        handler(args, ctx)
+    except UserError as exc:
+        log_error(str(exc))
+        sys.exit(1)
@@ -0,0 +1,215 @@
+"""Argument parser for the agent-wt CLI, split into one factory per subcommand."""
+
+from __future__ import annotations
+
+import argparse
+import functools
+
+# Shared argparse literals, built once and reused by every subcommand factory.
+_NAME_HELP = "Worktree label."
+_UPDATE_NAME_HELP = "Worktree label to update."
+_AGENT_HELP = "Agent label (codex|claude|gemini)."
+_DIRTY_HELP = "Permit launching when the worktree is dirty."
+_SANDBOX_HELP = "Run the agent via sandbox-exec."
+_NO_SANDBOX_HELP = "Disable sandbox-exec for this worktree."
+_PROFILE_HELP = "Path to a custom sandbox-exec profile."
+_WRITE_HELP = "Additional writable paths for the built-in sandbox profile (repeatable)."
+_NO_NETWORK_HELP = "Disable network access in the sandbox."
+_NETWORK_HELP = "Allow network access in the sandbox."
+_LAUNCH_CHOICES = ("spawn", "terminal", "iterm")
+_OPEN_CHOICES = ("terminal", "iterm")
+_JSON_KW = dict(dest="json_output", action="store_true", help="Output JSON.")
+
+
+def _build_create(create: argparse.ArgumentParser) -> None:
+    create.add_argument("name", help=_NAME_HELP)
+    create.add_argument("--agent", default="codex", help=_AGENT_HELP)
+    create.add_argument("--base", default="main", help="Base ref for the worktree.")
+    create.add_argument("--branch", help="Branch name to create (default: wt/<name>).")
+    create.add_argument("--use-existing-branch", action="store_true", help="Attach to an existing branch instead of creating a new one.")
+    create.add_argument("--path", help="Target directory for the worktree.")
+    create.add_argument("--cmd", help="Command to start the agent (default: agent label).")
+    create.add_argument("--start", action="store_true", help="Start the agent immediately after creation.")
+    create.add_argument("--allow-dirty", action="store_true", help=_DIRTY_HELP)
+    create.add_argument(
+        "--launch",
+        choices=_LAUNCH_CHOICES,
+        default="spawn",
+        help="How to launch the agent when using --start (spawn in-place, Terminal, or iTerm).",
+    )
+    create_sandbox = create.add_mutually_exclusive_group()
+    create_sandbox.add_argument("--sandbox", action="store_true", help=_SANDBOX_HELP)
+    create_sandbox.add_argument("--no-sandbox", action="store_true", help=_NO_SANDBOX_HELP)
+    create.add_argument("--sandbox-profile", help=_PROFILE_HELP)
+    create.add_argument(
+        "--sandbox-write",
+        action="append",
+        default=None,
+        help=_WRITE_HELP,
+    )
+    create_network = create.add_mutually_exclusive_group()
+    create_network.add_argument("--sandbox-no-network", action="store_true", help=_NO_NETWORK_HELP)
+    create_network.add_argument("--sandbox-network", action="store_true", help=_NETWORK_HELP)
+
+
+def _build_run(run: argparse.ArgumentParser) -> None:
+    run.add_argument("name", help=_NAME_HELP)
+    run.add_argument("--agent", help=_AGENT_HELP)
+    run.add_argument("--cmd", help="Command to start the agent.")
+    run.add_argument("--allow-dirty", action="store_true", help=_DIRTY_HELP)
+    run.add_argument(
+        "--launch",
+        choices=_LAUNCH_CHOICES,
+        default="spawn",
+        help="Launch via current process (spawn), Terminal, or iTerm.",
+    )
+    run_sandbox = run.add_mutually_exclusive_group()
+    run_sandbox.add_argument("--sandbox", action="store_true", help=_SANDBOX_HELP)
+    run_sandbox.add_argument("--no-sandbox", action="store_true", help="Disable sandbox-exec for this run.")
+    run.add_argument("--sandbox-profile", help=_PROFILE_HELP)
+    run.add_argument(
+        "--sandbox-write",
+        action="append",
+        default=None,
+        help=_WRITE_HELP,
+    )
+    run_network = run.add_mutually_exclusive_group()
+    run_network.add_argument("--sandbox-no-network", action="store_true", help=_NO_NETWORK_HELP)
+    run_network.add_argument("--sandbox-network", action="store_true", help=_NETWORK_HELP)
+
+
+def _build_list(list_cmd: argparse.ArgumentParser) -> None:
+    list_cmd.add_argument("--json", **_JSON_KW)
+
+
+def _build_info(info: argparse.ArgumentParser) -> None:
+    info.add_argument("name", help=_NAME_HELP)
+    info.add_argument("--json", **_JSON_KW)
+
+
+def _build_set(set_cmd: argparse.ArgumentParser) -> None:
+    set_cmd.add_argument("name", help=_UPDATE_NAME_HELP)
+    set_cmd.add_argument("--agent", help="New agent label (codex|claude|gemini).")
+    set_cmd.add_argument("--cmd", help="New command to launch the agent.")
+    set_cmd.add_argument("--path", help="Override path if moved.")
+    set_sandbox = set_cmd.add_mutually_exclusive_group()
+    set_sandbox.add_argument("--sandbox", action="store_true", help="Enable sandbox-exec for this worktree.")
+    set_sandbox.add_argument("--no-sandbox", action="store_true", help=_NO_SANDBOX_HELP)
+    set_cmd.add_argument("--sandbox-profile", help=_PROFILE_HELP)
+    set_cmd.add_argument(
+        "--sandbox-write",
+        action="append",
+        default=None,
+        help=_WRITE_HELP,
+    )
+    set_network = set_cmd.add_mutually_exclusive_group()
+    set_network.add_argument("--sandbox-no-network", action="store_true", help=_NO_NETWORK_HELP)
+    set_network.add_argument("--sandbox-network", action="store_true", help=_NETWORK_HELP)
+
+
+def _build_set_env(set_env: argparse.ArgumentParser) -> None:
+    set_env.add_argument("name", help=_UPDATE_NAME_HELP)
+    set_env.add_argument("env", nargs="*", help="KEY=VALUE pairs to set/update.")
+    set_env.add_argument("--unset", nargs="*", default=[], help="Keys to remove.")
+
+
+def _build_remove(remove: argparse.ArgumentParser) -> None:
+    remove.add_argument("name", help="Worktree label to remove.")
+    remove.add_argument("--delete-path", action="store_true", help="Delete the worktree path via git worktree remove --force.")
+    remove.add_argument("--delete-branch", action="store_true", help="Delete the worktree branch.")
+    remove.add_argument("--prune", action="store_true", help="Delete both path and branch (shorthand).")
+    remove.add_argument("--force", action="store_true", help="Ignore missing paths/branches and continue.")
+
+
+def _build_prune(prune: argparse.ArgumentParser) -> None:
+    prune.add_argument("--delete-branch", action="store_true", help="Delete branches when pruning.")
+    prune.add_argument("--orphaned-branch", action="store_true", help="Remove entries whose branch is missing (even if path exists).")
+    prune.add_argument("--force", action="store_true", help="Keep going on branch delete failures.")
+    prune.add_argument("--json", **_JSON_KW)
+    prune.add_argument("--dry-run", action="store_true", help="Do not write changes; just report.")
+
+
+def _build_git(git_cmd: argparse.ArgumentParser) -> None:
+    git_cmd.add_argument("name", help=_NAME_HELP)
+    git_cmd.add_argument("git_args", nargs=argparse.REMAINDER, help="Args after -- passed to git.")
+
+
+def _build_open(open_cmd: argparse.ArgumentParser) -> None:
+    open_cmd.add_argument("name", help=_NAME_HELP)
+    open_cmd.add_argument(
+        "--launch",
+        choices=_OPEN_CHOICES,
+        default="terminal",
+        help="Which app to open.",
+    )
+
+
+def _build_diff(diff_cmd: argparse.ArgumentParser) -> None:
+    diff_cmd.add_argument("name", help=_NAME_HELP)
+    diff_cmd.add_argument("git_args", nargs=argparse.REMAINDER, help="Extra args for git diff.")
+
+
+def _build_commit(commit_cmd: argparse.ArgumentParser) -> None:
+    commit_cmd.add_argument("name", help=_NAME_HELP)
+    commit_cmd.add_argument("-m", "--message", required=True, help="Commit message.")
+    commit_cmd.add_argument("-a", "--all", action="store_true", help="git add -A before commit.")
+
+
+def _build_push(push_cmd: argparse.ArgumentParser) -> None:
+    push_cmd.add_argument("name", help=_NAME_HELP)
+    push_cmd.add_argument("--remote", default="origin", help="Remote name (default origin).")
+    push_cmd.add_argument("--branch", help="Branch name (default: tracked branch).")
+
+
+# subcommand -> (help, factory adding its arguments); None means the command takes no arguments.
+_SUBCMD_BUILDERS = {
+    "create": ("Create a git worktree for an agent.", _build_create),
+    "run": ("Start the agent inside its worktree.", _build_run),
+    "list": ("List tracked worktrees.", _build_list),
+    "info": ("Show one tracked worktree.", _build_info),
+    "set": ("Update tracked metadata (agent/command/path/sandbox).", _build_set),
+    "set-env": ("Update per-worktree environment variables.", _build_set_env),
+    "remove": ("Untrack a worktree (optionally delete path/branch).", _build_remove),
+    "prune": ("Prune config entries with missing paths (optionally delete orphaned branches).", _build_prune),
+    "git": ("Run git inside a tracked worktree.", _build_git),
+    "open": ("Open a shell in Terminal/iTerm at the worktree path.", _build_open),
+    "diff": ("Show git diff inside a worktree.", _build_diff),
+    "commit": ("Add and commit inside a worktree.", _build_commit),
+    "push": ("Push a worktree branch.", _build_push),
+    "gui": ("Start a minimal GUI launcher (macOS).", None),
+    "version": ("Show version.", None),
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with ``only`` set, register just that subcommand."""
+    parser = argparse.ArgumentParser(prog="agent-wt", add_help=False)
+    parser.add_argument("-h", "--help", action="help", help="Show help and exit.")
+    sub = parser.add_subparsers(dest="command")
+    names = [only] if only in _SUBCMD_BUILDERS else list(_SUBCMD_BUILDERS)
+    for name in names:
+        help_text, build = _SUBCMD_BUILDERS[name]
+        sub_parser = sub.add_parser(name, help=help_text)
+        if build is not None:
+            build(sub_parser)
+    return parser
+
+
+def build_subparser(command: str) -> argparse.ArgumentParser:
+    """Build a standalone parser for one subcommand, for parsing the args after its name."""
+    _, build = _SUBCMD_BUILDERS[command]
+    parser = argparse.ArgumentParser(prog=f"agent-wt {command}")
+    if build is not None:
+        build(parser)
+    return parser
+
+
+# Parsers are not mutated by parse_args(), so long-lived callers (GUI, tests) can share them.
+@functools.lru_cache(maxsize=None)
+def cached_parser(only: str | None = None) -> argparse.ArgumentParser:
+    return build_parser(only)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_subparser(command: str) -> argparse.ArgumentParser:
+    return build_subparser(command)
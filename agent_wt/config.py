@@ -1,69 +1,185 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import copy
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
 
 from .errors import UserError
-from .git_utils import inspect_worktree
+from .git_utils import inspect_worktree, inspect_worktrees_bulk, list_git_worktrees, worktree_is_live
 
+try:  # optional: orjson parses/serializes in C, stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
-def config_path(ctx) -> Path:
-    return ctx.common_dir / "agent-wt" / "config.json"
 
+def _loads(blob: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
 
-def read_config(config_path: Path) -> Dict[str, Any]:
-    if not config_path.exists():
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+# config path -> (mtime_ns, size, parsed data); callers get deep copies since handlers mutate them.
+_CFG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+class SerializedWorktree(NamedTuple):
+    """Display/JSON view of one tracked worktree; ``_asdict()`` at the JSON boundary."""
+
+    name: str
+    path: str
+    branch: str
+    base: str
+    agent: str
+    command: str
+    env: Dict[str, Any]
+    sandbox: Dict[str, Any]
+    createdAt: str
+    status: str
+    dirty: Any
+    ahead: Any
+    behind: Any
+    upstream: Any
+
+
+def config_path(ctx) -> str:
+    return os.path.join(ctx.common_dir, "agent-wt", "config.json")
+
+
+def read_config(config_path: str | os.PathLike) -> Dict[str, Any]:
+    config_path = os.fspath(config_path)
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         return {"version": 1, "worktrees": {}}
+    cached = _CFG_CACHE.get(config_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
     try:
-        with config_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        with open(config_path, "rb") as fh:
+            data = _loads(fh.read())
         data.setdefault("worktrees", {})
-        return data
     except Exception as exc:  # noqa: BLE001
         return {"version": 1, "worktrees": {}}
+    _CFG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
 
 
-def write_config(config_path: Path, data: Dict[str, Any]) -> None:
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    with config_path.open("w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
-        fh.write("\n")
+def write_config(config_path: str | os.PathLike, data: Dict[str, Any]) -> None:
+    config_path = os.fspath(config_path)
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    blob = _dumps(data)
+    # One write into a uniquely named sibling, then an atomic rename: readers never see a
+    # partial config and concurrent writers never share a temp file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_path), prefix=".config.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=0) as fh:
+            os.fchmod(fh.fileno(), _existing_mode(config_path))
+            fh.write(blob)
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    _CFG_CACHE.pop(config_path, None)
 
 
-def serialize_worktree(name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
-    path = Path(entry.get("path", ""))
-    exists = path.exists()
-    git_state = {}
+def _existing_mode(path: str) -> int:
+    # mkstemp creates 0600 files; keep the mode the config already had.
     try:
-        git_state = inspect_worktree(path)
-    except Exception:
-        git_state = {}
-    return {
-        "name": name,
-        "path": str(path),
-        "branch": entry.get("branch", ""),
-        "base": entry.get("base", ""),
-        "agent": entry.get("agent", ""),
-        "command": entry.get("command", ""),
-        "env": entry.get("env", {}),
-        "sandbox": entry.get("sandbox", {}),
-        "createdAt": entry.get("createdAt", ""),
-        "status": "ready" if exists else "missing",
-        "dirty": git_state.get("dirty"),
-        "ahead": git_state.get("ahead"),
-        "behind": git_state.get("behind"),
-        "upstream": git_state.get("upstream"),
-    }
-
-
-def list_worktrees(ctx) -> List[Dict[str, Any]]:
-    cfg = read_config(config_path(ctx))
-    return [serialize_worktree(name, entry) for name, entry in cfg["worktrees"].items()]
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o644
+
+
+def serialize_worktree(
+    name: str,
+    entry: Dict[str, Any],
+    git_state: Dict[str, Any] | None = None,
+    exists: bool | None = None,
+) -> SerializedWorktree:
+    raw_path = entry.get("path", "")
+    if not raw_path:
+        # Nothing to probe: an entry without a path is reported as missing.
+        exists, git_state = False, {}
+    else:
+        if exists is None:
+            exists = os.path.exists(raw_path)
+        if git_state is None:
+            git_state = inspect_worktree(Path(raw_path)) if exists else {}
+    return SerializedWorktree(
+        name=name,
+        path=raw_path,
+        branch=entry.get("branch", ""),
+        base=entry.get("base", ""),
+        agent=entry.get("agent", ""),
+        command=entry.get("command", ""),
+        env=entry.get("env", {}),
+        sandbox=entry.get("sandbox", {}),
+        createdAt=entry.get("createdAt", ""),
+        status="ready" if exists else "missing",
+        dirty=git_state.get("dirty"),
+        ahead=git_state.get("ahead"),
+        behind=git_state.get("behind"),
+        upstream=git_state.get("upstream"),
+    )
+
 
+def existing_paths(paths: List[Path]) -> Set[Path]:
+    """Return the subset of ``paths`` that exist, listing each parent directory once."""
+    by_parent: Dict[Path, List[Path]] = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+    present: Set[Path] = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {de.name for de in it}
+        except OSError:
+            present.update(child for child in children if child.exists())
+            continue
+        # Names missing from the listing may still exist on case- or normalization-
+        # insensitive filesystems (APFS/HFS+); let the filesystem decide for those.
+        present.update(child for child in children if child.name in names or child.exists())
+    return present
 
-def get_worktree_entry(ctx, name: str) -> Dict[str, Any]:
+
+def list_worktrees(ctx, max_workers: int = 8) -> List[SerializedWorktree]:
     cfg = read_config(config_path(ctx))
+    entries = [(name, entry, Path(entry.get("path", ""))) for name, entry in cfg["worktrees"].items()]
+    if not entries:
+        return []
+    present = existing_paths([path for _, _, path in entries])
+    try:
+        registered = list_git_worktrees(ctx.root)
+    except Exception:
+        registered = None
+    # Only directories git still tracks as worktrees are worth a status call.
+    inspectable = [
+        path for _, _, path in entries if path in present and (registered is None or worktree_is_live(registered, path))
+    ]
+    states = inspect_worktrees_bulk(inspectable, max_workers=max_workers)
+    return [
+        serialize_worktree(name, entry, states.get(path, {}), exists=path in present)
+        for name, entry, path in entries
+    ]
+
+
+def get_worktree_entry(ctx, name: str, cfg: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    if cfg is None:
+        cfg = read_config(config_path(ctx))
     entry = cfg["worktrees"].get(name)
     if not entry:
         raise UserError(f'Worktree "{name}" is not tracked. Use "agent-wt create {name}" first.')
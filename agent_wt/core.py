@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import argparse
-import json
+import datetime
+import functools
+import hashlib
 import os
-import platform
-import shlex
+import re
 import shutil
 import subprocess
 import sys
@@ -21,9 +21,17 @@ from .config import (
     write_config,
 )
 from .errors import UserError
-from .git_utils import git_branch_exists, inspect_worktree, run_git
+from .git_utils import (
+    git_branch_exists,
+    inspect_worktree,
+    list_git_worktrees,
+    local_branches,
+    run_git,
+    worktree_is_live,
+)
 
-SUPPORTED_AGENTS = ["codex", "claude", "gemini"]
+SUPPORTED_AGENTS = ("codex", "claude", "gemini")
+_PROFILE_DIGEST = re.compile(r"[0-9a-f]{16}")
 
 
 def log(msg: str = "") -> None:
@@ -41,15 +49,14 @@ class Ctx:
 
 
 def ensure_macos() -> None:
-    if platform.system().lower() != "darwin":
+    if sys.platform != "darwin":
         raise UserError("This build is macOS-first; current platform is not macOS (darwin).")
 
 
 def ensure_git_repo(cwd: Path) -> Ctx:
     try:
-        root = Path(run_git(["rev-parse", "--show-toplevel"], cwd))
-        common_dir = Path(run_git(["rev-parse", "--git-common-dir"], cwd))
-        return Ctx(root=root, common_dir=common_dir)
+        root_str, common_str = run_git(["rev-parse", "--show-toplevel", "--git-common-dir"], cwd).splitlines()[:2]
+        return Ctx(root=Path(root_str), common_dir=Path(common_str))
     except Exception as exc:  # noqa: BLE001
         raise UserError(f"agent-wt must be run inside a git repository with worktree support. {exc}")
 
@@ -60,7 +67,9 @@ def default_worktree_path(repo_root: Path, name: str) -> Path:
     return (parent / f"{repo_base}-{name}").resolve()
 
 
+@functools.lru_cache(maxsize=None)
 def default_agent_command(agent: str) -> str:
+    # Cached for the process lifetime: AGENT_WT_CMD_* overrides are read once.
     if agent not in SUPPORTED_AGENTS:
         return ""
     env_key = f"AGENT_WT_CMD_{agent.upper()}"
@@ -75,8 +84,38 @@ def default_agent_command(agent: str) -> str:
     return defaults.get(agent, agent)
 
 
-def escape_for_applescript(cmd: str) -> str:
-    return cmd.replace("\\", "\\\\").replace('"', '\\"')
+# Characters that only a shell interprets (pipes, expansion, redirection, globbing, ...).
+_SHELL_META = frozenset("|&;<>()$`\\*?[]{}#~!\n")
+# Builtins and reserved words have no executable to exec; they only work through a shell.
+_SHELL_WORDS = frozenset(
+    {
+        ".", ":", "alias", "break", "builtin", "case", "cd", "command", "continue", "do", "done",
+        "elif", "else", "esac", "eval", "exec", "exit", "export", "fi", "for", "function", "hash",
+        "if", "local", "read", "readonly", "return", "select", "set", "shift", "source", "then",
+        "time", "times", "trap", "type", "ulimit", "umask", "unalias", "unset", "until", "wait", "while",
+    }
+)
+
+
+def needs_shell(command: str) -> bool:
+    """True when ``command`` uses shell syntax and cannot be exec'd from a plain shlex split."""
+    if any(ch in _SHELL_META for ch in command):
+        return True
+    words = command.split(None, 1)
+    # A leading VAR=value word is an environment assignment, not the program to run.
+    return not words or "=" in words[0] or words[0] in _SHELL_WORDS
+
+
+def direct_argv(command: str) -> Optional[List[str]]:
+    """argv to exec ``command`` without a shell, or None when it has to go through /bin/sh."""
+    if needs_shell(command):
+        return None
+    import shlex
+
+    try:
+        return shlex.split(command)
+    except ValueError:
+        return None  # e.g. an unbalanced quote; /bin/sh reports the syntax error
 
 
 def merged_env(entry: Dict[str, Any]) -> Dict[str, str]:
@@ -102,16 +141,22 @@ def normalize_sandbox_entry(raw: Any) -> Dict[str, Any]:
 
 
 def normalize_write_paths(paths: List[str]) -> List[str]:
-    normalized = []
-    for item in paths:
-        if not item:
-            continue
-        normalized.append(str(Path(item).expanduser().resolve()))
-    return normalized
+    """Resolve, dedupe and drop paths already covered by another entry's subpath rule."""
+    resolved = {str(Path(item).expanduser().resolve()) for item in dict.fromkeys(paths) if item}
+    kept: List[str] = []
+    for path in sorted(resolved, key=len):
+        if not any(path.startswith(parent.rstrip(os.sep) + os.sep) for parent in kept):
+            kept.append(path)
+    return sorted(kept)
 
 
 def apply_sandbox_args(base: Dict[str, Any], ns) -> Dict[str, Any]:
-    sandbox = normalize_sandbox_entry(base)
+    return apply_sandbox_overrides(normalize_sandbox_entry(base), ns)
+
+
+def apply_sandbox_overrides(normalized: Dict[str, Any], ns) -> Dict[str, Any]:
+    """Apply CLI sandbox flags to an already-normalized entry, returning a new dict."""
+    sandbox = dict(normalized)
     if getattr(ns, "no_sandbox", False):
         return {"enabled": False, "profile": "", "deny_network": False, "write": []}
     if getattr(ns, "sandbox", False):
@@ -131,8 +176,11 @@ def apply_sandbox_args(base: Dict[str, Any], ns) -> Dict[str, Any]:
     return sandbox
 
 
+_SBPL_TRANS = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def escape_sbpl_string(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.translate(_SBPL_TRANS)
 
 
 def build_sandbox_profile(
@@ -175,9 +223,7 @@ def ensure_sandbox_profile(ctx: Ctx, name: str, worktree_path: Path, sandbox: Di
         return None
     if shutil.which("sandbox-exec") is None:
         raise UserError("sandbox-exec is required for --sandbox.")
-    common_dir = ctx.common_dir
-    if not common_dir.is_absolute():
-        common_dir = (ctx.root / common_dir).resolve()
+    common_dir = absolute_common_dir(ctx)
     profile_override = sandbox.get("profile") or ""
     if profile_override:
         profile_path = Path(profile_override).expanduser().resolve()
@@ -185,33 +231,113 @@ def ensure_sandbox_profile(ctx: Ctx, name: str, worktree_path: Path, sandbox: Di
             raise UserError(f"sandbox profile does not exist: {profile_path}")
         return profile_path
     profile_dir = common_dir / "agent-wt" / "sandbox"
-    profile_path = profile_dir / f"{name}.sb"
     profile_body = build_sandbox_profile(
         worktree_path,
         common_dir,
         deny_network=bool(sandbox.get("deny_network", False)),
         extra_writes=sandbox.get("write") or [],
     )
-    profile_dir.mkdir(parents=True, exist_ok=True)
+    # Content-addressed name: an existing file is already up to date, no read/compare needed.
+    body_bytes = profile_body.encode("utf-8")
+    digest = hashlib.sha256(body_bytes).hexdigest()[:16]
+    profile_path = profile_dir / f"{name}-{digest}.sb"
     if profile_path.exists():
-        existing = profile_path.read_text(encoding="utf-8")
-        if existing == profile_body:
-            return profile_path
-    profile_path.write_text(profile_body, encoding="utf-8")
+        return profile_path
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename, so sandbox-exec never reads a half-written profile.
+    tmp_path = profile_dir / f".{name}-{digest}.{os.getpid()}.sb.tmp"
+    try:
+        tmp_path.write_bytes(body_bytes)
+        os.replace(tmp_path, profile_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    prune_sandbox_profiles(profile_dir, name, keep=profile_path)
     return profile_path
 
 
+def prune_sandbox_profiles(profile_dir: Path, name: str, *, keep: Path) -> None:
+    """Remove generated profiles for ``name`` other than ``keep`` (including the old unhashed name)."""
+    prefix = f"{name}-"
+    for candidate in profile_dir.glob("*.sb"):
+        stem = candidate.stem
+        stale = stem == name or (stem.startswith(prefix) and _PROFILE_DIGEST.fullmatch(stem[len(prefix):]))
+        if stale and candidate != keep:
+            candidate.unlink(missing_ok=True)
+
+
 def wrap_command_with_sandbox(command: str, profile_path: Path) -> str:
+    import shlex
+
     quoted_cmd = shlex.quote(command)
     return f"sandbox-exec -f {shlex.quote(str(profile_path))} /bin/sh -c {quoted_cmd}"
 
 
+# AppleScript launchers take the shell command as their first argument, so it never needs
+# AppleScript escaping and each script is compiled only once.
+_OSA_SOURCES = {
+    "terminal": (
+        "on run argv\n"
+        '  tell application "Terminal"\n'
+        "    activate\n"
+        "    do script (item 1 of argv)\n"
+        "  end tell\n"
+        "end run\n"
+    ),
+    "iterm": (
+        "on run argv\n"
+        '  tell application "iTerm2"\n'
+        "    activate\n"
+        "    tell current window\n"
+        "      create tab with default profile\n"
+        "      tell current session to write text (item 1 of argv)\n"
+        "    end tell\n"
+        "  end tell\n"
+        "end run\n"
+    ),
+}
+
+
+def absolute_common_dir(ctx: Ctx) -> Path:
+    common_dir = ctx.common_dir
+    if not common_dir.is_absolute():
+        common_dir = (ctx.root / common_dir).resolve()
+    return common_dir
+
+
+def launcher_dir(ctx: Ctx) -> Path:
+    return absolute_common_dir(ctx) / "agent-wt" / "osa"
+
+
+def compiled_launcher(app: str, script_dir: Path) -> Path:
+    source = _OSA_SOURCES[app]
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    script_path = script_dir / f"{app}-{digest}.scpt"
+    if script_path.exists():
+        return script_path
+    if shutil.which("osacompile") is None:
+        raise UserError("osacompile is required to open Terminal/iTerm sessions.")
+    script_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = script_dir / f".{app}-{digest}.{os.getpid()}.scpt"
+    try:
+        result = subprocess.run(["osacompile", "-o", str(tmp_path)], input=source, text=True)
+        if result.returncode != 0:
+            raise UserError(f"Failed to compile {app} launcher (osacompile exit {result.returncode}).")
+        os.replace(tmp_path, script_path)
+    except BaseException:
+        # osacompile may leave a partial output behind when it fails.
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return script_path
+
+
 def run_in_macos_app(
     worktree_path: Path,
     command: str,
     app: str,
     *,
     entry: Dict[str, Any],
+    script_dir: Path,
     sandbox_profile: Path | None = None,
 ) -> None:
     app = app.lower()
@@ -222,36 +348,26 @@ def run_in_macos_app(
     if shutil.which("osascript") is None:
         raise UserError("osascript is required to open Terminal/iTerm sessions.")
 
+    import shlex
+
     env_parts = " ".join([f"{shlex.quote(k)}={shlex.quote(v)}" for k, v in (entry.get("env") or {}).items()])
     prefix = f"{env_parts} " if env_parts else ""
     shell_cmd = f"cd {shlex.quote(str(worktree_path))} && {prefix}{command}"
     if sandbox_profile:
         shell_cmd = wrap_command_with_sandbox(shell_cmd, sandbox_profile)
-    quoted = escape_for_applescript(shell_cmd)
 
-    if app == "terminal":
-        script = f'tell application "Terminal"\\n activate\\n do script "{quoted}"\\nend tell'
-    else:
-        script = (
-            'tell application "iTerm2"\\n'
-            "  activate\\n"
-            "  tell current window\\n"
-            "    create tab with default profile\\n"
-            f'    tell current session to write text "{quoted}"\\n'
-            "  end tell\\n"
-            "end tell"
-        )
-    result = subprocess.run(["osascript", "-e", script])
+    launcher = compiled_launcher(app, script_dir)
+    result = subprocess.run(["osascript", str(launcher), shell_cmd])
     if result.returncode != 0:
         raise UserError(f"Failed to launch {app} session (osascript exit {result.returncode}).")
 
 
 def render_table(items, headers):
-    rows = [[str(item.get(h, "")) for h in headers] for item in items]
-    widths = [max(len(h), *(len(row[idx]) for row in rows)) for idx, h in enumerate(headers)]
+    rows = [[str(getattr(item, h, "")) for h in headers] for item in items]
+    widths = [max(map(len, col)) for col in zip(headers, *rows)]
 
     def fmt(row):
-        return "  ".join(cell.ljust(widths[idx]) for idx, cell in enumerate(row))
+        return "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
 
     yield fmt(headers)
     yield fmt(["-" * w for w in widths])
@@ -304,12 +420,14 @@ def handle_create(ns, ctx: Ctx):
         "command": command,
         "env": {},
         "sandbox": sandbox,
-        "createdAt": subprocess.run(["date", "-u", "+%Y-%m-%dT%H:%M:%SZ"], text=True, capture_output=True).stdout.strip(),
+        "createdAt": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
     write_config(cfg_path, config)
     log(f'Worktree "{name}" ready at {target_path}.')
 
     if ns.start:
+        import argparse
+
         handle_run(
             argparse.Namespace(  # type: ignore[arg-type]
                 name=name,
@@ -318,17 +436,20 @@ def handle_create(ns, ctx: Ctx):
                 wait=True,
                 launch=getattr(ns, "launch", "spawn"),
                 allow_dirty=ns.allow_dirty,
+                skip_status=True,  # just checked out, cannot be dirty yet
             ),
             ctx,
+            cfg=config,  # just written; no need to read it back from disk
         )
 
 
-def handle_run(ns, ctx: Ctx, *, wait: Optional[bool] = None):
+def handle_run(ns, ctx: Ctx, *, wait: Optional[bool] = None, cfg: Optional[Dict[str, Any]] = None):
     name = ns.name
     wait = ns.wait if hasattr(ns, "wait") else wait
     launch = getattr(ns, "launch", "spawn")
     allow_dirty = getattr(ns, "allow_dirty", False)
-    entry = get_worktree_entry(ctx, name)
+    skip_status = getattr(ns, "skip_status", False)
+    entry = get_worktree_entry(ctx, name, cfg)
 
     agent = (ns.agent or entry.get("agent") or "codex").lower()
     if agent not in SUPPORTED_AGENTS:
@@ -342,7 +463,7 @@ def handle_run(ns, ctx: Ctx, *, wait: Optional[bool] = None):
     if not command:
         raise UserError('No command specified for this agent. Provide one with --cmd "<your agent command>".')
 
-    if not allow_dirty:
+    if not allow_dirty and not skip_status:
         state = inspect_worktree(worktree_path)
         if state.get("dirty"):
             raise UserError("Worktree is dirty. Commit/stash or re-run with --allow-dirty.")
@@ -352,14 +473,31 @@ def handle_run(ns, ctx: Ctx, *, wait: Optional[bool] = None):
 
     if launch != "spawn":
         log(f'Starting {agent} in {worktree_path} via {launch} using "{command}"...')
-        run_in_macos_app(worktree_path, command, launch, entry=entry, sandbox_profile=sandbox_profile)
+        run_in_macos_app(
+            worktree_path,
+            command,
+            launch,
+            entry=entry,
+            script_dir=launcher_dir(ctx),
+            sandbox_profile=sandbox_profile,
+        )
         return
 
     log(f'Starting {agent} in {worktree_path} using "{command}"...')
+    env = merged_env(entry)
     if sandbox_profile:
         command = wrap_command_with_sandbox(command, sandbox_profile)
-    env = merged_env(entry)
-    proc = subprocess.Popen(command, cwd=worktree_path, shell=True, env=env)  # noqa: S602
+    argv = None if sandbox_profile else direct_argv(command)
+    try:
+        if argv is None:
+            proc = subprocess.Popen(command, cwd=worktree_path, shell=True, env=env)  # noqa: S602
+        else:
+            try:
+                proc = subprocess.Popen(argv, cwd=worktree_path, env=env)
+            except FileNotFoundError:
+                raise UserError(f'Agent command not found: "{command}". Provide one with --cmd "<your agent command>".')
+    except OSError as exc:
+        raise UserError(f'Failed to start "{command}": {exc.strerror or exc}')
     if wait is None:
         wait = True
     if wait:
@@ -371,7 +509,9 @@ def handle_run(ns, ctx: Ctx, *, wait: Optional[bool] = None):
 def handle_list(ns, ctx: Ctx):
     items = list_worktrees(ctx)
     if ns.json_output:
-        log(json.dumps({"worktrees": items}, indent=2))
+        import json
+
+        log(json.dumps({"worktrees": [item._asdict() for item in items]}, indent=2))
         return
     if not items:
         log("No agent worktrees are tracked yet. Use `agent-wt create <name>` to add one.")
@@ -386,20 +526,22 @@ def handle_info(ns, ctx: Ctx):
     entry = get_worktree_entry(ctx, name)
     data = serialize_worktree(name, entry)
     if ns.json_output:
-        log(json.dumps(data, indent=2))
+        import json
+
+        log(json.dumps(data._asdict(), indent=2))
         return
-    log(f"name:    {data['name']}")
-    log(f"agent:   {data['agent']}")
-    log(f"branch:  {data['branch']}")
-    log(f"base:    {data['base']}")
-    log(f"path:    {data['path']}")
-    log(f"status:  {data['status']}")
-    log(f"dirty:   {data.get('dirty')}")
-    log(f"ahead:   {data.get('ahead')}, behind: {data.get('behind')}, upstream: {data.get('upstream')}")
-    log(f"command: {data['command'] or '(not set)'}")
-    if data.get("sandbox"):
-        log(f"sandbox: {data['sandbox']}")
-    log(f"created: {data['createdAt'] or '(unknown)'}")
+    log(f"name:    {data.name}")
+    log(f"agent:   {data.agent}")
+    log(f"branch:  {data.branch}")
+    log(f"base:    {data.base}")
+    log(f"path:    {data.path}")
+    log(f"status:  {data.status}")
+    log(f"dirty:   {data.dirty}")
+    log(f"ahead:   {data.ahead}, behind: {data.behind}, upstream: {data.upstream}")
+    log(f"command: {data.command or '(not set)'}")
+    if data.sandbox:
+        log(f"sandbox: {data.sandbox}")
+    log(f"created: {data.createdAt or '(unknown)'}")
 
 
 def handle_set(ns, ctx: Ctx):
@@ -423,8 +565,9 @@ def handle_set(ns, ctx: Ctx):
     if ns.path:
         entry["path"] = str(Path(ns.path).expanduser().resolve())
         changed = True
-    sandbox = apply_sandbox_args(entry.get("sandbox", {}), ns)
-    if sandbox != normalize_sandbox_entry(entry.get("sandbox", {})):
+    original_sandbox = normalize_sandbox_entry(entry.get("sandbox", {}))
+    sandbox = apply_sandbox_overrides(original_sandbox, ns)
+    if sandbox != original_sandbox:
         entry["sandbox"] = sandbox
         changed = True
     if not changed:
@@ -443,6 +586,7 @@ def handle_set_env(ns, ctx: Ctx):
     if not entry:
         raise UserError(f'Worktree "{name}" is not tracked.')
     env = entry.get("env") or {}
+    original = dict(env)
     updates = ns.env or []
     removals = ns.unset or []
     for pair in updates:
@@ -452,6 +596,9 @@ def handle_set_env(ns, ctx: Ctx):
         env[key] = val
     for key in removals:
         env.pop(key, None)
+    if env == original:
+        log(f'Env for "{name}" unchanged.')
+        return
     entry["env"] = env
     cfg["worktrees"][name] = entry
     write_config(cfg_path, cfg)
@@ -505,16 +652,21 @@ def handle_prune(ns, ctx: Ctx):
     cfg = read_config(cfg_path)
     removed = []
     kept = {}
+    existing_branches = local_branches(ctx.root)
+    registered = list_git_worktrees(ctx.root)
     for name, entry in cfg["worktrees"].items():
         path = Path(entry.get("path", ""))
         branch = entry.get("branch", "")
-        missing_path = not path.exists()
-        missing_branch = branch and not git_branch_exists(branch, ctx.root)
+        # A live git worktree record settles it; otherwise (unregistered or prunable) check the disk.
+        missing_path = not worktree_is_live(registered, path) and not path.exists()
+        missing_branch = branch and branch not in existing_branches
         if missing_path or (ns.orphaned_branch and missing_branch):
-            if ns.delete_branch and branch and git_branch_exists(branch, ctx.root):
+            if ns.delete_branch and branch and branch in existing_branches:
                 log(f"[prune] deleting branch {branch}")
                 res = subprocess.run(["git", "branch", "-D", branch], cwd=ctx.root)
-                if res.returncode != 0 and not ns.force:
+                if res.returncode == 0:
+                    existing_branches.discard(branch)
+                elif not ns.force:
                     raise UserError(f"Failed to delete branch {branch} (git exit {res.returncode}).")
             removed.append({"name": name, "missing_path": missing_path, "missing_branch": missing_branch, "branch": branch})
         else:
@@ -523,6 +675,8 @@ def handle_prune(ns, ctx: Ctx):
         cfg["worktrees"] = kept
         write_config(cfg_path, cfg)
     if ns.json_output:
+        import json
+
         log(json.dumps({"removed": removed, "kept": list(kept.keys())}, indent=2))
         return
     if not removed:
@@ -540,7 +694,8 @@ def handle_git(ns, ctx: Ctx):
     worktree_path = Path(entry.get("path", ""))
     if not worktree_path.exists():
         raise UserError(f"Worktree path does not exist: {worktree_path}")
-    cmd = ["git", *git_args]
+    pager = ["--no-pager"] if getattr(ns, "no_pager", False) else []
+    cmd = ["git", *pager, *git_args]
     log(f"[{name}] git {' '.join(git_args)}")
     result = subprocess.run(cmd, cwd=worktree_path)
     if result.returncode != 0:
@@ -555,7 +710,7 @@ def handle_open(ns, ctx: Ctx):
         raise UserError(f"Worktree path does not exist: {worktree_path}")
     launch = ns.launch
     command = "exec $SHELL"
-    run_in_macos_app(worktree_path, command, launch, entry=entry)
+    run_in_macos_app(worktree_path, command, launch, entry=entry, script_dir=launcher_dir(ctx))
     log(f'Opened {name} in {launch}.')
 
 
@@ -566,7 +721,8 @@ def handle_diff(ns, ctx: Ctx):
     if not worktree_path.exists():
         raise UserError(f"Worktree path does not exist: {worktree_path}")
     extra = ns.git_args or []
-    cmd = ["git", "diff", *extra]
+    pager = ["--no-pager"] if getattr(ns, "no_pager", False) else []
+    cmd = ["git", *pager, "diff", *extra]
     result = subprocess.run(cmd, cwd=worktree_path)
     if result.returncode != 0:
         raise UserError(f"git diff exited with {result.returncode}")
@@ -591,6 +747,11 @@ def handle_commit(ns, ctx: Ctx):
     log(f"[{name}] {' '.join(commit_cmd)}")
     res_commit = subprocess.run(commit_cmd, cwd=worktree_path)
     if res_commit.returncode != 0:
+        # `git commit -a` would skip untracked files, so --all keeps `git add -A` (two forks);
+        # only on failure check whether the add simply left nothing staged.
+        if subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=worktree_path).returncode == 0:
+            log(f"[{name}] Nothing to commit.")
+            return
         raise UserError(f"git commit failed with {res_commit.returncode}")
     log("Commit created.")
 
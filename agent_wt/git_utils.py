@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Set
 
 
 def run_git(args, cwd: Path, allow_fail: bool = False) -> str:
@@ -28,18 +30,73 @@ def git_branch_exists(branch: str, cwd: Path) -> bool:
     return result.returncode == 0
 
 
+def local_branches(cwd: Path) -> Set[str]:
+    """All local branch names from a single for-each-ref, for loops that test many branches."""
+    output = run_git(["for-each-ref", "--format=%(refname)", "refs/heads"], cwd)
+    prefix = "refs/heads/"
+    return {line[len(prefix):] for line in output.splitlines() if line.startswith(prefix)}
+
+
+def parse_worktree_list(output: str) -> Dict[str, Dict[str, str]]:
+    """Parse ``git worktree list --porcelain`` into {path: {HEAD, branch, locked, prunable, ...}}."""
+    worktrees: Dict[str, Dict[str, str]] = {}
+    record: Dict[str, str] = {}
+    for line in output.splitlines() + [""]:
+        if not line:
+            if "worktree" in record:
+                worktrees[os.path.normpath(record["worktree"])] = record
+            record = {}
+            continue
+        key, _, value = line.partition(" ")
+        record[key] = value
+    return worktrees
+
+
+def list_git_worktrees(cwd: Path) -> Dict[str, Dict[str, str]]:
+    """Every worktree git knows about for the repository at ``cwd``, from a single fork."""
+    return parse_worktree_list(run_git(["worktree", "list", "--porcelain"], cwd))
+
+
+def worktree_is_live(worktrees: Dict[str, Dict[str, str]], path: str | Path) -> bool:
+    record = worktrees.get(os.path.normpath(path))
+    return record is not None and "prunable" not in record
+
+
+def parse_status_v2(output: str) -> Dict[str, int | bool | str]:
+    """Parse ``git status --porcelain=v2 --branch`` into dirty/ahead/behind/upstream."""
+    dirty = False
+    ahead = behind = 0
+    upstream = ""
+    for line in output.splitlines():
+        if not line.startswith("#"):
+            dirty = True
+        elif line.startswith("# branch.upstream "):
+            upstream = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            try:
+                ahead_str, behind_str = line[len("# branch.ab "):].split()
+                ahead = int(ahead_str.lstrip("+"))
+                behind = int(behind_str.lstrip("-"))
+            except ValueError:
+                ahead = behind = 0
+    return {"dirty": dirty, "ahead": ahead, "behind": behind, "upstream": upstream}
+
+
 def inspect_worktree(path: Path) -> Dict[str, int | bool | str]:
     if not path.exists():
         return {}
-    dirty = bool(run_git(["status", "--porcelain"], path, allow_fail=True))
-    ahead = behind = 0
-    upstream = run_git(["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"], path, allow_fail=True)
-    if upstream:
-        counts = run_git(["rev-list", "--left-right", "--count", f"HEAD...{upstream}"], path, allow_fail=True)
-        try:
-            behind_str, ahead_str = counts.split()
-            behind = int(behind_str)
-            ahead = int(ahead_str)
-        except Exception:
-            ahead = behind = 0
-    return {"dirty": dirty, "ahead": ahead, "behind": behind, "upstream": upstream}
+    try:
+        # One fork gives file changes plus upstream and ahead/behind counts.
+        output = run_git(["status", "--porcelain=v2", "--branch"], path)
+    except Exception:
+        return {}
+    return parse_status_v2(output)
+
+
+def inspect_worktrees_bulk(paths: List[Path], max_workers: int = 8) -> Dict[Path, Dict[str, int | bool | str]]:
+    """Inspect several worktrees concurrently; git startup dominates, so the calls overlap well."""
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {path: inspect_worktree(path) for path in unique}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+        return dict(zip(unique, pool.map(inspect_worktree, unique)))
@@ -1,24 +1,227 @@
 from __future__ import annotations
 
-import argparse
+import contextlib
+import importlib
+import itertools
+import operator
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from tkinter import messagebox, simpledialog, ttk
 import tkinter as tk
 
-from .config import get_worktree_entry, list_worktrees
-from .core import (
-    SUPPORTED_AGENTS,
-    handle_commit,
-    handle_create,
-    handle_diff,
-    handle_git,
-    handle_open,
-    handle_remove,
-    handle_run,
-    handle_set,
-)
+from .config import config_path, get_worktree_entry, list_worktrees
 from .errors import UserError
 
 
+# Background git work from the GUI runs at most _GIT_CONCURRENCY git processes at once.
+# Button actions queue on their own pool, one git process per job; refreshes get a
+# separate thread, so a slow push never holds up the table, and their per-worktree
+# status calls use the remaining slots.
+_GIT_CONCURRENCY = 3
+_ACTION_WORKERS = 1
+_REFRESH_GIT_WORKERS = _GIT_CONCURRENCY - _ACTION_WORKERS
+_executor = ThreadPoolExecutor(max_workers=_ACTION_WORKERS, thread_name_prefix="agent-wt-git")
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-wt-refresh")
+_POLL_MS = 20
+
+
+def submit_git(fn, *args):
+    """Queue a git-backed action ``fn(*args)`` and return its future."""
+    return _executor.submit(fn, *args)
+
+
+def submit_refresh(fn, *args):
+    """Queue a listing job on the refresh thread and return its future."""
+    return _refresh_executor.submit(fn, *args)
+
+
+# Adaptive refresh debounce, in milliseconds.
+_DEBOUNCE_BASE_MS = 150
+_DEBOUNCE_STEP_MS = 50
+_DEBOUNCE_CAP_MS = 1000
+_DEBOUNCE_MAX_WAIT_MS = 2000
+_BURST_WINDOW_S = 1.0
+# Row changes at or above this count are applied with the table unpacked.
+_BULK_ROWS = 100
+# Rows are materialized in pages; the next page loads once the view nears the bottom.
+_PAGE_ROWS = 200
+_PAGE_TRIGGER = 0.9
+
+_LAUNCH_VALUES = ("spawn", "terminal", "iterm")
+_COLUMNS = ("name", "branch", "agent", "status", "dirty", "ahead", "behind", "path")
+_COLUMN_WIDTHS = {"dirty": 80, "ahead": 80, "behind": 80, "path": 360}
+_DEFAULT_COLUMN_WIDTH = 120
+# SerializedWorktree -> row values tuple, in column order.
+_row_values = operator.attrgetter(*_COLUMNS)
+
+
+# Names resolved from .core on first use, so importing the GUI does not pull in core.
+_core_names = {}
+
+
+def _h(name):
+    try:
+        return _core_names[name]
+    except KeyError:
+        value = _core_names[name] = getattr(importlib.import_module(".core", __package__), name)
+        return value
+
+
+# Argument objects for the core handlers, which only read attributes off their ``ns``.
+# They stand in for argparse.Namespace on the click path.
+@dataclass
+class RunArgs:
+    name: str
+    agent: str | None = None
+    cmd: str | None = None
+    wait: bool = False
+    launch: str = "spawn"
+    allow_dirty: bool = False
+    sandbox: bool = False
+    no_sandbox: bool = False
+    sandbox_profile: str | None = None
+    sandbox_write: list[str] | None = None
+    sandbox_no_network: bool = False
+    sandbox_network: bool = False
+
+
+@dataclass
+class CreateArgs:
+    name: str
+    agent: str = "codex"
+    base: str = "main"
+    branch: str | None = None
+    path: str | None = None
+    cmd: str | None = None
+    start: bool = False
+    allow_dirty: bool = False
+    use_existing_branch: bool = False
+    launch: str = "spawn"
+    sandbox: bool = False
+    no_sandbox: bool = False
+    sandbox_profile: str | None = None
+    sandbox_write: list[str] | None = None
+    sandbox_no_network: bool = False
+    sandbox_network: bool = False
+
+
+@dataclass
+class RemoveArgs:
+    name: str
+    delete_path: bool = False
+    delete_branch: bool = False
+    prune: bool = False
+    force: bool = False
+
+
+@dataclass
+class OpenArgs:
+    name: str
+    launch: str
+
+
+@dataclass
+class GitArgs:
+    name: str
+    git_args: list[str]
+    # Output goes to the launching terminal; a pager there would hold the worker indefinitely.
+    no_pager: bool = True
+
+
+@dataclass
+class PushArgs:
+    name: str
+    remote: str = "origin"
+    branch: str | None = None
+
+
+@dataclass
+class CommitArgs:
+    name: str
+    message: str
+    all: bool = True
+
+
+@dataclass
+class SetArgs:
+    name: str
+    agent: str | None = None
+    cmd: str | None = None
+    path: str | None = None
+
+
+def _when_done(root, future, fn, *args) -> None:
+    """Call ``fn(future, *args)`` on the Tk thread once ``future`` finishes.
+
+    Polling from the Tk side keeps every Tk call on the main thread, which is the only
+    thread Tk tolerates (and works before mainloop() has started).
+    """
+    try:
+        if future.done():
+            fn(future, *args)
+        else:
+            root.after(_POLL_MS, _when_done, root, future, fn, *args)
+    except tk.TclError:
+        pass  # window destroyed while the work was running
+
+
+# common_dir -> (monotonic timestamp, config mtime_ns, list_worktrees() result)
+_list_cache = {}
+_LIST_TTL = 2.0
+
+
+def _config_mtime(ctx):
+    try:
+        return os.stat(config_path(ctx)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _cached_list(ctx, ttl: float = _LIST_TTL):
+    """list_worktrees() reused for ``ttl`` seconds while the config file is unchanged."""
+    key = str(ctx.common_dir)
+    mtime = _config_mtime(ctx)
+    hit = _list_cache.get(key)
+    if hit is not None and hit[1] == mtime and time.monotonic() - hit[0] <= ttl:
+        return hit[2]
+    items = list_worktrees(ctx, max_workers=_REFRESH_GIT_WORKERS)
+    _list_cache[key] = (time.monotonic(), mtime, items)
+    return items
+
+
+def _forget_list(ctx) -> None:
+    _list_cache.pop(str(ctx.common_dir), None)
+
+
+@contextlib.contextmanager
+def frozen(tree):
+    """Hide all columns while rows are rebuilt so Tk lays the table out once, not per insert."""
+    saved = tree.cget("displaycolumns")
+    tree.configure(displaycolumns=())
+    try:
+        yield tree
+    finally:
+        tree.configure(displaycolumns=saved)
+
+
+@contextlib.contextmanager
+def detached(widget):
+    """Take a packed widget out of the layout during bulk edits and put it back in place."""
+    info = widget.pack_info()
+    siblings = widget.master.pack_slaves()
+    idx = siblings.index(widget)
+    after = siblings[idx + 1] if idx + 1 < len(siblings) else None
+    widget.pack_forget()
+    try:
+        yield widget
+    finally:
+        if after is not None:
+            info["before"] = after
+        widget.pack(**info)
+
+
 def run_gui(ctx):
     root = tk.Tk()
     root.title("agent-wt")
@@ -32,20 +235,140 @@ def run_gui(ctx):
     sandbox_profile_var = tk.StringVar(root, value="")
     sandbox_write_var = tk.StringVar(root, value="")
 
-    columns = ("name", "branch", "agent", "status", "dirty", "ahead", "behind", "path")
+    # Parsed forms of the sandbox text fields, recomputed once per edit rather than per click.
+    sandbox_inputs = {"write": [], "profile": None}
+
+    def parse_sandbox_write():
+        sandbox_inputs["write"] = [item.strip() for item in sandbox_write_var.get().split(",") if item.strip()]
+
+    def parse_sandbox_profile():
+        sandbox_inputs["profile"] = sandbox_profile_var.get().strip() or None
+
+    # Variable traces only mark state dirty; the updates run once per idle cycle, and
+    # readers call flush_state() first so a click right after typing never sees stale values.
+    state_updates = {"write": parse_sandbox_write, "profile": parse_sandbox_profile}
+    state_flush = {"pending": False, "dirty": set()}
+
+    def schedule_state_flush(key):
+        state_flush["dirty"].add(key)
+        if not state_flush["pending"]:
+            state_flush["pending"] = True
+            root.after_idle(flush_state)
+
+    def flush_state():
+        if not state_flush["pending"]:
+            return
+        state_flush["pending"] = False
+        dirty, state_flush["dirty"] = state_flush["dirty"], set()
+        for key in dirty:
+            state_updates[key]()
+
+    sandbox_write_var.trace_add("write", lambda *_: schedule_state_flush("write"))
+    sandbox_profile_var.trace_add("write", lambda *_: schedule_state_flush("profile"))
+
+    columns = _COLUMNS
     tree = ttk.Treeview(root, columns=columns, show="headings")
+    # Straight Tcl calls: the ttk.Treeview heading/column wrappers add option parsing per call.
+    call = tree.tk.call
     for col in columns:
-        tree.heading(col, text=col)
-        width = 80 if col in {"dirty", "ahead", "behind"} else 120
-        if col == "path":
-            width = 360
-        tree.column(col, width=width, anchor="w")
+        call(tree, "heading", col, "-text", col)
+        call(tree, "column", col, "-width", _COLUMN_WIDTHS.get(col, _DEFAULT_COLUMN_WIDTH), "-anchor", "w")
     tree.pack(fill="both", expand=True, padx=8, pady=8)
 
+    # iid -> row values for every worktree, and for the rows materialized in the tree.
+    # Only the first paging["limit"] rows are inserted, and only changed rows are touched.
+    all_rows = {}
+    shown = {}
+    paging = {"limit": _PAGE_ROWS, "pending": False}
+
+    def on_yscroll(first, last):
+        if paging["pending"] or float(last) < _PAGE_TRIGGER or len(shown) >= len(all_rows):
+            return
+        paging["pending"] = True
+        root.after_idle(load_next_page)
+
+    def load_next_page():
+        paging["pending"] = False
+        paging["limit"] += _PAGE_ROWS
+        # Appending while the user scrolls: unpacking here would flash the table.
+        sync_rows(unpack=False)
+
+    tree.configure(yscrollcommand=on_yscroll)
+
+    refresh_generation = [0]
+
     def refresh():
-        tree.delete(*tree.get_children())
-        for item in list_worktrees(ctx):
-            tree.insert("", "end", iid=item["name"], values=[item[col] for col in columns])
+        # list_worktrees shells out to git per worktree; keep that off the Tk thread.
+        refresh_generation[0] += 1
+        generation = refresh_generation[0]
+        _when_done(root, submit_refresh(_cached_list, ctx), apply_refresh, generation, time.monotonic())
+
+    # Collapse bursts of refresh requests into one listing: each request inside the
+    # burst window pushes the delay out a little, but nothing waits past the max.
+    # The base delay backs off while refreshes take longer than it (git is congested)
+    # and decays back once they are quick again.
+    pending = {"after_id": None, "first": None, "recent": [], "base": _DEBOUNCE_BASE_MS}
+
+    def schedule_refresh():
+        now = time.monotonic()
+        recent = [ts for ts in pending["recent"] if now - ts < _BURST_WINDOW_S]
+        recent.append(now)
+        pending["recent"] = recent
+        if pending["after_id"] is not None:
+            root.after_cancel(pending["after_id"])
+        if pending["first"] is None:
+            pending["first"] = now
+        waited_ms = int((now - pending["first"]) * 1000)
+        delay = min(pending["base"] + _DEBOUNCE_STEP_MS * (len(recent) - 1), _DEBOUNCE_CAP_MS)
+        delay = max(0, min(delay, _DEBOUNCE_MAX_WAIT_MS - waited_ms))
+        pending["after_id"] = root.after(delay, do_scheduled_refresh)
+
+    def do_scheduled_refresh():
+        pending["after_id"] = None
+        pending["first"] = None
+        refresh()
+
+    def apply_refresh(future, generation, started):
+        elapsed_ms = (time.monotonic() - started) * 1000
+        if elapsed_ms > pending["base"]:
+            pending["base"] = min(pending["base"] * 2, _DEBOUNCE_CAP_MS)
+        else:
+            pending["base"] = max(pending["base"] // 2, _DEBOUNCE_BASE_MS)
+        if generation != refresh_generation[0]:
+            return  # a newer refresh is already in flight
+        try:
+            items = future.result()
+        except UserError as exc:
+            messagebox.showerror("agent-wt", str(exc))
+            return
+        all_rows.clear()
+        all_rows.update((item.name, _row_values(item)) for item in items)
+        sync_rows()
+
+    def sync_rows(unpack=True):
+        new_state = dict(itertools.islice(all_rows.items(), paging["limit"]))
+        removed = [iid for iid in shown if iid not in new_state]
+        changed = [iid for iid, values in new_state.items() if iid in shown and shown[iid] != values]
+        added = [iid for iid in new_state if iid not in shown]
+        if not (removed or changed or added):
+            return
+        bulk = unpack and len(removed) + len(added) >= _BULK_ROWS
+        with (detached(tree) if bulk else contextlib.nullcontext()), frozen(tree):
+            if removed:
+                tree.delete(*removed)
+            update_row = tree.item
+            for iid in changed:
+                update_row(iid, values=new_state[iid])
+            # Surviving rows keep their relative order, so inserting additions at their
+            # final index (in ascending order) reproduces the config order.
+            positions = {iid: idx for idx, iid in enumerate(new_state)}
+            insert_row = tree.insert
+            for iid in added:
+                insert_row("", positions[iid], iid=iid, values=new_state[iid])
+        if bulk:
+            root.update_idletasks()
+        shown.clear()
+        shown.update(new_state)
 
     def run_selected():
         sel = tree.selection()
@@ -53,22 +376,18 @@ def run_gui(ctx):
             messagebox.showinfo("agent-wt", "Select a worktree to run.")
             return
         name = sel[0]
-        write_paths = [item.strip() for item in sandbox_write_var.get().split(",") if item.strip()]
+        flush_state()
         try:
-            handle_run(
-                argparse.Namespace(
+            _h("handle_run")(
+                RunArgs(
                     name=name,
-                    agent=None,
-                    cmd=None,
-                    wait=False,
                     launch=launch_var.get(),
                     allow_dirty=allow_dirty_var.get(),
                     sandbox=sandbox_var.get(),
                     no_sandbox=no_sandbox_var.get(),
-                    sandbox_profile=sandbox_profile_var.get().strip() or None,
-                    sandbox_write=write_paths or None,
+                    sandbox_profile=sandbox_inputs["profile"],
+                    sandbox_write=list(sandbox_inputs["write"]) or None,
                     sandbox_no_network=sandbox_no_network_var.get(),
-                    sandbox_network=False,
                 ),
                 ctx,
             )
@@ -84,11 +403,9 @@ def run_gui(ctx):
         if not messagebox.askyesno("agent-wt", f'Untrack "{name}"? (no path/branch deletion)'):
             return
         try:
-            handle_remove(
-                argparse.Namespace(name=name, delete_path=False, delete_branch=False, prune=False, force=False),
-                ctx,
-            )
-            refresh()
+            _h("handle_remove")(RemoveArgs(name=name), ctx)
+            _forget_list(ctx)
+            schedule_refresh()
         except UserError as exc:
             messagebox.showerror("agent-wt", str(exc))
 
@@ -99,7 +416,27 @@ def run_gui(ctx):
             return
         name = sel[0]
         try:
-            handle_open(argparse.Namespace(name=name, launch=app), ctx)
+            _h("handle_open")(OpenArgs(name=name, launch=app), ctx)
+        except UserError as exc:
+            messagebox.showerror("agent-wt", str(exc))
+
+    # git subprocesses can take a while (push especially), so run them on the worker pool
+    # and show what is in flight in the status line.
+    status_var = tk.StringVar(root, value="")
+    in_flight = []
+
+    def run_in_background(label, fn, *args):
+        if label in in_flight:
+            return  # the same operation is still running; a second push/pager would collide
+        in_flight.append(label)
+        status_var.set(f"Working\u2026 ({', '.join(in_flight)})")
+        _when_done(root, submit_git(fn, *args), finish_background, label)
+
+    def finish_background(future, label):
+        in_flight.remove(label)
+        status_var.set(f"Working\u2026 ({', '.join(in_flight)})" if in_flight else "")
+        try:
+            future.result()
         except UserError as exc:
             messagebox.showerror("agent-wt", str(exc))
 
@@ -109,10 +446,7 @@ def run_gui(ctx):
             messagebox.showinfo("agent-wt", "Select a worktree.")
             return
         name = sel[0]
-        try:
-            handle_git(argparse.Namespace(name=name, git_args=["status"]), ctx)
-        except UserError as exc:
-            messagebox.showerror("agent-wt", str(exc))
+        run_in_background(f"git status {name}", _h("handle_git"), GitArgs(name=name, git_args=["status"]), ctx)
 
     def git_diff():
         sel = tree.selection()
@@ -120,10 +454,7 @@ def run_gui(ctx):
             messagebox.showinfo("agent-wt", "Select a worktree.")
             return
         name = sel[0]
-        try:
-            handle_diff(argparse.Namespace(name=name, git_args=[]), ctx)
-        except UserError as exc:
-            messagebox.showerror("agent-wt", str(exc))
+        run_in_background(f"git diff {name}", _h("handle_diff"), GitArgs(name=name, git_args=[]), ctx)
 
     def git_push():
         sel = tree.selection()
@@ -131,12 +462,7 @@ def run_gui(ctx):
             messagebox.showinfo("agent-wt", "Select a worktree.")
             return
         name = sel[0]
-        try:
-            handle_open  # noqa: B018
-            from .core import handle_push  # local import to avoid cycles
-            handle_push(argparse.Namespace(name=name, remote="origin", branch=None), ctx)
-        except UserError as exc:
-            messagebox.showerror("agent-wt", str(exc))
+        run_in_background(f"git push {name}", _h("handle_push"), PushArgs(name=name), ctx)
 
     def git_commit():
         sel = tree.selection()
@@ -144,49 +470,77 @@ def run_gui(ctx):
             messagebox.showinfo("agent-wt", "Select a worktree.")
             return
         name = sel[0]
+        if f"git commit {name}" in in_flight:
+            return
         msg = simpledialog.askstring("agent-wt", f'Commit message for "{name}":')
         if msg is None:
             return
-        try:
-            handle_commit(argparse.Namespace(name=name, message=msg, all=True), ctx)
-        except UserError as exc:
-            messagebox.showerror("agent-wt", str(exc))
+        run_in_background(f"git commit {name}", _h("handle_commit"), CommitArgs(name=name, message=msg), ctx)
+
+    # Built on first use, then hidden and re-shown; Toplevel construction is the slow part.
+    create_dialog = {}
+    create_defaults = {
+        "Name": "",
+        "Agent": "codex",
+        "Base": "main",
+        "Branch": "",
+        "Path": "",
+        "Command": "",
+    }
 
     def open_create_dialog():
+        if create_dialog:
+            dialog = create_dialog["dialog"]
+            # Only a closed dialog starts fresh; one that is still open (perhaps behind the
+            # main window) keeps what the user has typed.
+            if dialog.state() == "withdrawn":
+                reset_create_dialog()
+            dialog.deiconify()
+            dialog.lift()
+            create_dialog["entries"]["Name"].focus_set()
+            return
+        build_create_dialog()
+
+    def reset_create_dialog():
+        for label, widget in create_dialog["entries"].items():
+            if label == "Agent":
+                create_dialog["agent_var"].set(create_defaults[label])
+            else:
+                widget.delete(0, "end")
+                widget.insert(0, create_defaults[label])
+
+    def build_create_dialog():
         dialog = tk.Toplevel(root)
         dialog.title("Create worktree")
         dialog.geometry("420x320")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
 
-        labels = ["Name", "Agent", "Base", "Branch", "Path", "Command"]
-        defaults = {
-            "Agent": "codex",
-            "Base": "main",
-            "Branch": "",
-            "Path": "",
-            "Command": "",
-        }
+        labels = list(create_defaults)
         entries = {}
         for idx, label in enumerate(labels):
             tk.Label(dialog, text=label).grid(row=idx, column=0, sticky="w", padx=8, pady=4)
             if label == "Agent":
-                agent_var = tk.StringVar(dialog, defaults[label])
-                widget = ttk.Combobox(dialog, textvariable=agent_var, values=SUPPORTED_AGENTS, state="readonly")
+                agent_var = tk.StringVar(dialog, create_defaults[label])
+                widget = ttk.Combobox(dialog, textvariable=agent_var, values=_h("SUPPORTED_AGENTS"), state="readonly")
                 widget.grid(row=idx, column=1, sticky="we", padx=8, pady=4)
                 entries[label] = widget
+                create_dialog["agent_var"] = agent_var
             else:
                 entry = tk.Entry(dialog)
-                entry.insert(0, defaults.get(label, ""))
+                entry.insert(0, create_defaults[label])
                 entry.grid(row=idx, column=1, sticky="we", padx=8, pady=4)
                 entries[label] = entry
         dialog.columnconfigure(1, weight=1)
+        create_dialog["dialog"] = dialog
+        create_dialog["entries"] = entries
 
         def on_create(start_after=False):
             name_val = entries["Name"].get().strip()
             if not name_val:
                 messagebox.showerror("agent-wt", "Name is required.")
                 return
-            write_paths = [item.strip() for item in sandbox_write_var.get().split(",") if item.strip()]
-            ns = argparse.Namespace(
+            flush_state()
+            ns = CreateArgs(
                 name=name_val,
                 agent=entries["Agent"].get().strip() or "codex",
                 base=entries["Base"].get().strip() or "main",
@@ -195,26 +549,24 @@ def run_gui(ctx):
                 cmd=entries["Command"].get().strip() or None,
                 start=start_after,
                 allow_dirty=allow_dirty_var.get(),
-                use_existing_branch=False,
                 launch=launch_var.get(),
                 sandbox=sandbox_var.get(),
                 no_sandbox=no_sandbox_var.get(),
-                sandbox_profile=sandbox_profile_var.get().strip() or None,
-                sandbox_write=write_paths or None,
+                sandbox_profile=sandbox_inputs["profile"],
+                sandbox_write=list(sandbox_inputs["write"]) or None,
                 sandbox_no_network=sandbox_no_network_var.get(),
-                sandbox_network=False,
             )
             try:
-                handle_create(ns, ctx)
-                refresh()
+                _h("handle_create")(ns, ctx)
+                _forget_list(ctx)
+                schedule_refresh()
                 if start_after:
                     try:
-                        handle_run(
-                            argparse.Namespace(
+                        _h("handle_run")(
+                            RunArgs(
                                 name=name_val,
                                 agent=ns.agent,
                                 cmd=ns.cmd,
-                                wait=False,
                                 launch=launch_var.get(),
                                 allow_dirty=allow_dirty_var.get(),
                             ),
@@ -222,7 +574,7 @@ def run_gui(ctx):
                         )
                     except UserError as exc:  # noqa: BLE001
                         messagebox.showerror("agent-wt", f"Created, but failed to start: {exc}")
-                dialog.destroy()
+                dialog.withdraw()
             except UserError as exc:
                 messagebox.showerror("agent-wt", str(exc))
 
@@ -230,7 +582,7 @@ def run_gui(ctx):
         btn_frame.grid(row=len(labels), column=0, columnspan=2, pady=12)
         tk.Button(btn_frame, text="Create", command=lambda: on_create(False)).pack(side="left", padx=4)
         tk.Button(btn_frame, text="Create & Start", command=lambda: on_create(True)).pack(side="left", padx=4)
-        tk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side="left", padx=4)
+        tk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side="left", padx=4)
 
     def edit_command():
         sel = tree.selection()
@@ -243,8 +595,9 @@ def run_gui(ctx):
         if new_cmd is None:
             return
         try:
-            handle_set(argparse.Namespace(name=name, agent=None, cmd=new_cmd, path=None), ctx)
-            refresh()
+            _h("handle_set")(SetArgs(name=name, cmd=new_cmd), ctx)
+            _forget_list(ctx)
+            schedule_refresh()
         except UserError as exc:
             messagebox.showerror("agent-wt", str(exc))
 
@@ -254,7 +607,7 @@ def run_gui(ctx):
     ttk.Combobox(
         btns,
         textvariable=launch_var,
-        values=["spawn", "terminal", "iterm"],
+        values=_LAUNCH_VALUES,
         state="readonly",
         width=10,
     ).pack(side="left", padx=4)
@@ -266,7 +619,7 @@ def run_gui(ctx):
     tk.Entry(btns, textvariable=sandbox_profile_var, width=16).pack(side="left", padx=4)
     tk.Label(btns, text="Write paths").pack(side="left", padx=4)
     tk.Entry(btns, textvariable=sandbox_write_var, width=18).pack(side="left", padx=4)
-    tk.Button(btns, text="Refresh", command=refresh).pack(side="left", padx=4)
+    tk.Button(btns, text="Refresh", command=schedule_refresh).pack(side="left", padx=4)
     tk.Button(btns, text="Run Selected", command=run_selected).pack(side="left", padx=4)
     tk.Button(btns, text="Create...", command=open_create_dialog).pack(side="left", padx=4)
     tk.Button(btns, text="Edit Command", command=edit_command).pack(side="left", padx=4)
@@ -277,6 +630,7 @@ def run_gui(ctx):
     tk.Button(btns, text="Git Diff", command=git_diff).pack(side="left", padx=4)
     tk.Button(btns, text="Git Commit", command=git_commit).pack(side="left", padx=4)
     tk.Button(btns, text="Git Push", command=git_push).pack(side="left", padx=4)
+    tk.Label(root, textvariable=status_var, anchor="w").pack(fill="x", padx=8, pady=(0, 4))
 
     refresh()
     root.mainloop()
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+from agent_wt import _parser, cli
+
+
+def test_version_fast_path_skips_parser(monkeypatch, capsys):
+    def boom():
+        raise AssertionError("build_parser should not run for version")
+
+    monkeypatch.setattr(_parser, "build_parser", boom)
+    cli.main(["--version"])
+    assert capsys.readouterr().out == f"{cli.VERSION}\n"
+
+
+@pytest.mark.skipif(not cli.STATIC_USAGE_OK, reason="static usage is not used on this Python")
+def test_static_usage_matches_parser(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+    assert cli.USAGE == cli.build_parser().format_usage()
+
+
+def test_importing_cli_is_lazy():
+    code = "import sys, agent_wt.cli; print('agent_wt._parser' in sys.modules, 'agent_wt.core' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False", "False"]
+
+
+def test_subparser_matches_full_parser():
+    argv = ["git", "demo", "--", "status", "-s"]
+    full = vars(_parser.build_parser().parse_args(argv))
+    full.pop("command")
+    assert vars(_parser.build_subparser("git").parse_args(argv[1:])) == full
+
+
+@pytest.mark.skipif(not cli.STATIC_HELP_OK, reason="static help is not used on this Python")
+def test_static_help_matches_parser(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+    assert cli.HELP == cli.build_parser().format_help()
+
+
+def test_help_matches_parser_on_every_python(monkeypatch, capsys):
+    monkeypatch.setenv("COLUMNS", "80")
+    cli.main(["--help"])
+    assert capsys.readouterr().out == cli.build_parser().format_help()
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from agent_wt.config import config_path, read_config, serialize_worktree, write_config
+from agent_wt.config import config_path, existing_paths, read_config, serialize_worktree, write_config
 from agent_wt.core import Ctx
 
 
@@ -16,4 +16,31 @@ def test_read_write_config(tmp_path):
 def test_serialize_worktree_missing_path():
     entry = {"path": "/nonexistent/path", "branch": "wt/x", "agent": "codex"}
     data = serialize_worktree("x", entry)
-    assert data["status"] == "missing"
+    assert data.status == "missing"
+
+
+def test_read_config_returns_fresh_copies(tmp_path):
+    cfg_file = tmp_path / "config.json"
+    write_config(cfg_file, {"version": 1, "worktrees": {"demo": {"branch": "wt/demo"}}})
+    first = read_config(cfg_file)
+    first["worktrees"]["demo"]["branch"] = "mutated"
+    assert read_config(cfg_file)["worktrees"]["demo"]["branch"] == "wt/demo"
+
+
+def test_existing_paths_scans_parents(tmp_path):
+    (tmp_path / "a").mkdir()
+    paths = [tmp_path / "a", tmp_path / "b", tmp_path / "missing-parent" / "c"]
+    assert existing_paths(paths) == {tmp_path / "a"}
+
+
+def test_existing_paths_falls_back_for_unlisted_names(tmp_path):
+    (tmp_path / "a").mkdir()
+    # ".." never appears in a directory listing, like a differently cased name on APFS.
+    alias = tmp_path / "a" / ".."
+    assert existing_paths([alias, tmp_path / "a" / "missing"]) == {alias}
+
+
+def test_read_config_parses_utf8_bytes(tmp_path):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_bytes('{"worktrees": {"démo": {"branch": "wt/ünï"}}}'.encode("utf-8"))
+    assert read_config(cfg_file)["worktrees"]["démo"]["branch"] == "wt/ünï"
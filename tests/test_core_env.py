@@ -1,9 +1,11 @@
-from agent_wt.core import Ctx, default_agent_command, merged_env
+from agent_wt.core import Ctx, default_agent_command, direct_argv, merged_env, needs_shell, normalize_write_paths
 
 
 def test_default_agent_command_env_override(monkeypatch):
     monkeypatch.setenv("AGENT_WT_CMD_CODEX", "codex --profile foo")
+    default_agent_command.cache_clear()
     assert default_agent_command("codex") == "codex --profile foo"
+    default_agent_command.cache_clear()
 
 
 def test_merged_env_includes_entry_and_os(monkeypatch):
@@ -12,3 +14,23 @@ def test_merged_env_includes_entry_and_os(monkeypatch):
     env = merged_env(entry)
     assert env["FOO"] == "bar"
     assert env["BASE_ENV"] == "1"
+
+
+def test_needs_shell_only_for_shell_syntax():
+    assert not needs_shell("codex --profile 'a b' --model=x")
+    assert needs_shell("codex | tee log.txt")
+    assert needs_shell("FOO=1 codex")
+    assert needs_shell("exec codex")
+    assert needs_shell("source .venv/bin/activate")
+
+
+def test_direct_argv_falls_back_to_shell():
+    assert direct_argv("codex --profile 'a b'") == ["codex", "--profile", "a b"]
+    assert direct_argv("codex | tee log.txt") is None
+    assert direct_argv('echo "unterminated') is None
+
+
+def test_normalize_write_paths_dedupes_nested(tmp_path):
+    base = str(tmp_path / "a")
+    paths = [base + "/c", base, base + "/b", base, str(tmp_path / "ab"), ""]
+    assert normalize_write_paths(paths) == [str((tmp_path / "a").resolve()), str((tmp_path / "ab").resolve())]
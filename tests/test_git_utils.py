@@ -0,0 +1,39 @@
+from agent_wt.git_utils import parse_status_v2, parse_worktree_list, worktree_is_live
+
+
+def test_parse_status_v2_branch_headers():
+    output = "\n".join(
+        [
+            "# branch.oid 1234567890abcdef",
+            "# branch.head wt/demo",
+            "# branch.upstream origin/wt/demo",
+            "# branch.ab +2 -1",
+        ]
+    )
+    assert parse_status_v2(output) == {"dirty": False, "ahead": 2, "behind": 1, "upstream": "origin/wt/demo"}
+
+
+def test_parse_status_v2_dirty_without_upstream():
+    output = "# branch.oid 1234567890abcdef\n# branch.head main\n? notes.txt"
+    assert parse_status_v2(output) == {"dirty": True, "ahead": 0, "behind": 0, "upstream": ""}
+
+
+def test_parse_worktree_list_records():
+    output = "\n".join(
+        [
+            "worktree /repo",
+            "HEAD 1111111111111111111111111111111111111111",
+            "branch refs/heads/main",
+            "",
+            "worktree /repo-demo",
+            "HEAD 2222222222222222222222222222222222222222",
+            "branch refs/heads/wt/demo",
+            "prunable gitdir file points to non-existent location",
+            "",
+        ]
+    )
+    worktrees = parse_worktree_list(output)
+    assert worktrees["/repo"]["branch"] == "refs/heads/main"
+    assert worktree_is_live(worktrees, "/repo")
+    assert not worktree_is_live(worktrees, "/repo-demo")
+    assert not worktree_is_live(worktrees, "/elsewhere")